@@ -9,259 +9,438 @@ Requirements fulfilled:
 3. Includes automated tests
 """
 
-import pandas as pd
+import openpyxl
+import io
+import os
 import json
 import itertools
-from pathlib import Path
-import gc
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import BinaryIO, List, Literal, Optional, TextIO, Union
+from contextlib import closing
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_bicycles(excel_path: str) -> str:
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    from python_calamine import CalamineWorkbook  # optional Rust-based Excel reader
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import cython
+except ImportError:
+    # Pure-Python fallback: the type declarations below become no-ops
+    class cython:
+        @staticmethod
+        def locals(**_types):
+            return lambda func: func
+
+
+def generate_bicycles(excel_path: Union[str, BinaryIO], *, pretty: bool = False,
+                      workers: Optional[int] = None,
+                      fmt: Literal['json', 'ndjson'] = 'json') -> str:
     """
     Generate all possible bicycle modifications from Excel file.
     
     Args:
-        excel_path (str): Absolute path to Excel file (.xlsx)
+        excel_path (str or BinaryIO): Absolute path to Excel file (.xlsx), or
+            a binary file-like object with the workbook contents (read from the
+            start and left open, so it can be passed again)
+        pretty (bool): Indent the JSON output by two spaces (default: compact)
+        workers (int, optional): Number of worker processes to generate with
+            (default: generate in the calling process)
+        fmt (str): 'json' for a JSON array, 'ndjson' for one JSON object
+            per line (pretty is ignored for 'ndjson')
         
     Returns:
         str: JSON document containing all bicycle modifications
         
     Raises:
         FileNotFoundError: If Excel file doesn't exist
-        ValueError: If file is not .xlsx format
+        ValueError: If file is not .xlsx format, excel_path is neither a path
+            nor a file-like object, or fmt is unknown
         Exception: For other processing errors
     """
+    out = io.StringIO()
+    generate_bicycles_stream(excel_path, out, pretty=pretty, workers=workers, fmt=fmt)
+    return out.getvalue()
+
+
+def generate_bicycles_stream(excel_path: Union[str, BinaryIO], out: TextIO, *, pretty: bool = False,
+                             workers: Optional[int] = None,
+                             fmt: Literal['json', 'ndjson'] = 'json') -> None:
+    """
+    Write all possible bicycle modifications from Excel file to a text stream.
     
-    # Validate input
-    if not isinstance(excel_path, str):
-        raise ValueError("excel_path must be a string")
+    Bicycles are serialized one at a time as they are generated, so the
+    full catalog is never held in memory. With workers, up to
+    2 * workers + 1 shards (each every bicycle of one model, brake and
+    wheel option) are buffered: two pending per worker plus the one being
+    written.
+    
+    Args:
+        excel_path (str or BinaryIO): Absolute path to Excel file (.xlsx), or
+            a binary file-like object with the workbook contents (read from the
+            start and left open, so it can be passed again)
+        out (TextIO): Writable text stream receiving the JSON document
+        pretty (bool): Indent the JSON output by two spaces (default: compact)
+        workers (int, optional): Number of worker processes to generate with
+            (default: generate in the calling process)
+        fmt (str): 'json' for a JSON array, 'ndjson' for one JSON object
+            per line (pretty is ignored for 'ndjson')
+        
+    Raises:
+        FileNotFoundError: If Excel file doesn't exist
+        ValueError: If file is not .xlsx format, excel_path is neither a path
+            nor a file-like object, or fmt is unknown
+        Exception: For errors reading the Excel file
+        OSError: Errors writing to out are raised unchanged
+    """
     
-    excel_file = Path(excel_path)
-    if not excel_file.exists():
-        raise FileNotFoundError(f"Excel file not found: {excel_path}")
+    # Validate input
+    is_path = isinstance(excel_path, str)
+    if not is_path and not hasattr(excel_path, 'read'):
+        raise ValueError("excel_path must be a string or a binary file-like object")
     
-    if not excel_file.suffix.lower() == '.xlsx':
-        raise ValueError("Input file must be an Excel file (.xlsx)")
+    if fmt not in ('json', 'ndjson'):
+        raise ValueError(f"Unknown output format: {fmt!r} (expected 'json' or 'ndjson')")
     
-    try:
-        # Read Excel file with proper resource management
-        excel_data = None
-        designators = {}
-        general_specs = {}
+    if is_path:
+        if not excel_path.lower().endswith('.xlsx'):
+            raise ValueError("Input file must be an Excel file (.xlsx)")
         
         try:
-            # Read Excel file - assuming it has sheets: ID, GENERAL, and component sheets
-            excel_data = pd.ExcelFile(excel_path, engine='openpyxl')
+            os.stat(excel_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel file not found: {excel_path}") from None
+    
+    try:
+        # Read Excel file - assuming it has sheets: ID, GENERAL, and component sheets
+        # (the handle is closed deterministically when the block exits)
+        with closing(_open_workbook(excel_path)) as workbook:
+            sheet_names = _sheet_names(workbook)
             
             # Parse different sheets
-            if 'ID' in excel_data.sheet_names:
+            if 'ID' in sheet_names:
                 # Read ID sheet for designator structure
-                id_df = pd.read_excel(excel_path, sheet_name='ID', engine='openpyxl')
-                designators = _parse_id_sheet(id_df)
-                del id_df  # Explicit cleanup
+                designators = _parse_id_sheet(_sheet_rows(workbook, 'ID'))
             else:
                 # Fallback: try to parse from first sheet as combined format
-                df = pd.read_excel(excel_path, sheet_name=0, engine='openpyxl')
-                designators = _parse_combined_sheet(df)
-                del df  # Explicit cleanup
+                designators = _parse_combined_sheet(_sheet_rows(workbook, 0))
             
             # Read GENERAL sheet if exists
-            if 'GENERAL' in excel_data.sheet_names:
-                general_df = pd.read_excel(excel_path, sheet_name='GENERAL', engine='openpyxl')
-                general_specs = _parse_general_sheet(general_df)
-                del general_df  # Explicit cleanup
+            if 'GENERAL' in sheet_names:
+                general_specs = _parse_general_sheet(_sheet_rows(workbook, 'GENERAL'))
             else:
                 # Use default general specifications
-                general_specs = _get_default_general_specs()
-                
-        finally:
-            # Ensure Excel file handle is closed
-            if excel_data is not None:
-                excel_data.close()
-            # Force garbage collection to release file handles
-            gc.collect()
-        
-        # Parse component-specific sheets or use defaults
-        component_specs = _get_component_specifications()
-        
-        # Generate all bicycle combinations
-        bicycles = _generate_all_bicycles(designators, general_specs, component_specs)
-        
-        # Return as JSON string
-        return json.dumps(bicycles, indent=2)
+                general_specs = _DEFAULT_GENERAL_SPECS
         
     except Exception as e:
-        # Ensure cleanup even on error
-        gc.collect()
         raise Exception(f"Error processing Excel file: {e}")
+    
+    # Parse component-specific sheets or use defaults
+    component_specs = _COMPONENT_SPECS
+    
+    # Generate bicycle combinations lazily
+    if workers is not None and workers > 1:
+        bicycles = _generate_bicycles_parallel(designators, general_specs, component_specs, workers)
+    else:
+        bicycles = _generate_all_bicycles(designators, general_specs, component_specs)
+    
+    # Outside the try above: errors writing to out (e.g. a full disk) reach
+    # the caller with their own type
+    if fmt == 'ndjson':
+        _write_ndjson(out, bicycles)
+    else:
+        _write_json_array(out, bicycles, pretty)
+
+
+def _write_json_array(out, bicycles, pretty):
+    """Write bicycles to out as a JSON array, one bicycle at a time"""
+    if pretty:
+        # Same layout as dumping the whole list with a two-space indent
+        array_start, separator, array_end = "[\n  ", ",\n  ", "\n]"
+    else:
+        array_start, separator, array_end = "[", ",", "]"
+    
+    written = False
+    for bicycle in bicycles:
+        out.write(separator if written else array_start)
+        if pretty:
+            # Nest the item one level; JSON strings never contain raw newlines
+            out.write(_to_json(bicycle, pretty=True).replace("\n", "\n  "))
+        else:
+            out.write(_to_json(bicycle))
+        written = True
+    out.write(array_end if written else "[]")
+
+
+def _write_ndjson(out, bicycles):
+    """Write bicycles to out as JSON Lines, one compact object per line"""
+    for bicycle in bicycles:
+        out.write(_to_json(bicycle))
+        out.write("\n")
+
+
+def _to_json(obj, pretty=False):
+    """Serialize obj to a JSON string (orjson, then ujson when available)"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode()
+    if ujson is not None:
+        # Indents in C, unlike the stdlib's pure-Python indent path; output
+        # matches json.dumps once forward slashes are left unescaped
+        return ujson.dumps(obj, indent=2 if pretty else 0, escape_forward_slashes=False)
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _open_workbook(excel_path):
+    """Open Excel workbook (path or binary file-like) read-only, preferring calamine when installed"""
+    if CalamineWorkbook is not None:
+        if isinstance(excel_path, str):
+            return CalamineWorkbook.from_path(excel_path)
+        # calamine reads from the current position; rewind so a buffer that
+        # was already read (or passed in before) opens like a fresh one
+        if getattr(excel_path, 'seekable', lambda: False)():
+            excel_path.seek(0)
+        return CalamineWorkbook.from_filelike(excel_path)
+    return openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+
 
+def _sheet_names(workbook):
+    """List the sheet names of an open workbook"""
+    if CalamineWorkbook is not None:
+        return workbook.sheet_names
+    return workbook.sheetnames
 
-def _parse_id_sheet(id_df):
+
+def _sheet_rows(workbook, sheet):
+    """Return the rows of a sheet (by name, or by index) as tuples of cell values"""
+    if CalamineWorkbook is not None:
+        worksheet = (workbook.get_sheet_by_index(sheet) if isinstance(sheet, int)
+                     else workbook.get_sheet_by_name(sheet))
+        # Keep leading blank rows and columns, as openpyxl does, so both
+        # readers see the same grid for sheets that don't start at A1
+        data = worksheet.to_python(skip_empty_area=False)
+        # calamine reports empty cells as '' and every number as float
+        return [
+            tuple(None if v == '' else int(v) if isinstance(v, float) and v.is_integer() else v
+                  for v in row)
+            for row in data
+        ]
+    worksheet = workbook.worksheets[sheet] if isinstance(sheet, int) else workbook[sheet]
+    return list(worksheet.iter_rows(values_only=True))
+
+
+def _sheet_columns(rows):
+    """Map each header in the first row to the list of values below it"""
+    if not rows:
+        return {}
+    
+    header = rows[0]
+    columns = {}
+    for index, name in enumerate(header):
+        if name is not None:
+            columns.setdefault(str(name), [row[index] for row in rows[1:] if index < len(row)])
+    
+    return columns
+
+
+def _unique_values(column):
+    """Stripped, non-empty (interned) cell values of a column in first-seen order"""
+    return list(dict.fromkeys(
+        sys.intern(text) for value in column if value is not None and (text := str(value).strip())
+    ))
+
+
+def _parse_id_sheet(rows):
     """Parse ID sheet to extract designator values"""
     designators = {}
     
     # First row contains designator names
-    designator_names = id_df.columns.tolist()
-    
-    for col_name in designator_names:
-        # Get all non-null values for this designator
-        values = id_df[col_name].dropna().unique().tolist()
-        values = [str(v).strip() for v in values if str(v).strip()]
+    for col_name, column in _sheet_columns(rows).items():
+        values = _unique_values(column)
         if values:
             designators[col_name] = values
     
     return designators
 
 
-def _parse_combined_sheet(df):
+def _parse_combined_sheet(rows):
     """Parse combined sheet format (like the CSV) to extract designator values"""
     designators = {}
     
     # Extract unique non-empty values for each column
-    for col_name in df.columns:
-        values = df[col_name].dropna().unique()
-        clean_values = []
-        for val in values:
-            if pd.notna(val) and str(val).strip():
-                clean_values.append(str(val).strip())
-        if clean_values:
-            designators[col_name] = clean_values
+    for col_name, column in _sheet_columns(rows).items():
+        values = _unique_values(column)
+        if values:
+            designators[col_name] = values
     
     return designators
 
 
-def _parse_general_sheet(general_df):
+def _parse_general_sheet(rows):
     """Parse GENERAL sheet for common specifications"""
     general_specs = {}
     
-    if len(general_df) >= 2:
+    # Skip the header row and any blank rows
+    data_rows = [row for row in rows[1:] if any(v is not None for v in row)]
+    
+    if len(data_rows) >= 2:
         # First row is field names, second row is values
-        field_names = general_df.iloc[0].tolist()
-        field_values = general_df.iloc[1].tolist()
+        field_names = data_rows[0]
+        field_values = data_rows[1]
         
         for name, value in zip(field_names, field_values):
-            if pd.notna(name) and pd.notna(value):
+            if name is not None and value is not None:
                 general_specs[str(name)] = str(value)
     
     return general_specs
 
 
-def _get_default_general_specs():
-    """Default general specifications for all bicycles"""
+# Default general specifications for all bicycles (shared, treat as read-only)
+_DEFAULT_GENERAL_SPECS = {
+    "Manufacturer": "Bikes INC",
+    "Type": "City",
+    "Frame type": "Diamond",
+    "Frame material": "Aluminum",
+    "Operating temperature": "0 - 40 °C"
+}
+
+
+def _intern_specs(component_specs):
+    """Intern designators and field names of a component spec table"""
+    # Per-bicycle lookups and merges then compare keys by identity against
+    # the interned designators read from Excel
     return {
-        "Manufacturer": "Bikes INC",
-        "Type": "City",
-        "Frame type": "Diamond",
-        "Frame material": "Aluminum",
-        "Operating temperature": "0 - 40 °C"
+        category: {
+            sys.intern(designator): {sys.intern(field): value for field, value in specs.items()}
+            for designator, specs in table.items()
+        }
+        for category, table in component_specs.items()
     }
 
 
-def _get_component_specifications():
-    """Get component-specific specifications"""
-    return {
-        'brake_specs': {
-            "R": {
-                "Brake type": "Rim",
-                "Brake warranty": "2 years"
-            },
-            "D": {
-                "Brake type": "Disc",
-                "Brake warranty": "5 years",
-                "Operating temperature": "-20 - 50 °C"
-            }
+# Component-specific specifications (shared, treat as read-only)
+_COMPONENT_SPECS = _intern_specs({
+    'brake_specs': {
+        "R": {
+            "Brake type": "Rim",
+            "Brake warranty": "2 years"
         },
-        'wheel_specs': {
-            "26": {
-                "Wheel diameter": "26″",
-                "Recommended height": "168-174 cm"
-            },
-            "27": {
-                "Wheel diameter": "27″",
-                "Recommended height": "174-180 cm"
-            },
-            "29": {
-                "Wheel diameter": "29″",
-                "Recommended height": "180-186 cm"
-            }
+        "D": {
+            "Brake type": "Disc",
+            "Brake warranty": "5 years",
+            "Operating temperature": "-20 - 50 °C"
+        }
+    },
+    'wheel_specs': {
+        "26": {
+            "Wheel diameter": "26″",
+            "Recommended height": "168-174 cm"
+        },
+        "27": {
+            "Wheel diameter": "27″",
+            "Recommended height": "174-180 cm"
+        },
+        "29": {
+            "Wheel diameter": "29″",
+            "Recommended height": "180-186 cm"
+        }
+    },
+    'frame_specs': {
+        "S": {"Frame height": "16 in"},
+        "M": {"Frame height": "18 in"},
+        "L": {"Frame height": "20 in"}
+    },
+    'groupset_specs': {
+        "SH1": {
+            "Groupset manufacturer": "Shimano",
+            "Groupset name": "Acera",
+            "Gears": "27"
+        },
+        "SH2": {
+            "Groupset manufacturer": "Shimano",
+            "Groupset name": "Altus",
+            "Gears": "24"
         },
-        'frame_specs': {
-            "S": {"Frame height": "16 in"},
-            "M": {"Frame height": "18 in"},
-            "L": {"Frame height": "20 in"}
+        "SH3": {
+            "Groupset manufacturer": "Shimano",
+            "Groupset name": "Tourney",
+            "Gears": "18"
         },
-        'groupset_specs': {
-            "SH1": {
-                "Groupset manufacturer": "Shimano",
-                "Groupset name": "Acera",
-                "Gears": "27"
-            },
-            "SH2": {
-                "Groupset manufacturer": "Shimano",
-                "Groupset name": "Altus",
-                "Gears": "24"
-            },
-            "SH3": {
-                "Groupset manufacturer": "Shimano",
-                "Groupset name": "Tourney",
-                "Gears": "18"
-            },
-            "SH4": {
-                "Groupset manufacturer": "Shimano",
-                "Groupset name": "Deore",
-                "Gears": "30"
-            },
-            "SR1": {
-                "Groupset manufacturer": "SRAM",
-                "Groupset name": "X3",
-                "Gears": "21"
-            },
-            "SR2": {
-                "Groupset manufacturer": "SRAM",
-                "Groupset name": "X5",
-                "Gears": "27"
-            }
+        "SH4": {
+            "Groupset manufacturer": "Shimano",
+            "Groupset name": "Deore",
+            "Gears": "30"
         },
-        'suspension_specs': {
-            "-": {
-                "Has suspension": "FALSE",
-                "Suspension travel": "Not applicable"
-            },
-            "C": {
-                "Has suspension": "TRUE",
-                "Suspension travel": "80 mm"
-            },
-            "A": {
-                "Has suspension": "TRUE",
-                "Suspension travel": "120 mm"
-            }
+        "SR1": {
+            "Groupset manufacturer": "SRAM",
+            "Groupset name": "X3",
+            "Gears": "21"
         },
-        'color_specs': {
-            "01": {"Frame color": "RED", "Logo": "TRUE"},
-            "02": {"Frame color": "BLUE", "Logo": "TRUE"},
-            "03": {"Frame color": "CYAN", "Logo": "FALSE"},
-            "04": {"Frame color": "GREEN", "Logo": "TRUE"},
-            "05": {"Frame color": "YELLOW", "Logo": "FALSE"},
-            "06": {"Frame color": "BLACK", "Logo": "TRUE"},
-            "07": {"Frame color": "WHITE", "Logo": "FALSE"},
-            "08": {"Frame color": "ORANGE", "Logo": "TRUE"},
-            "09": {"Frame color": "PURPLE", "Logo": "FALSE"},
-            "10": {"Frame color": "PINK", "Logo": "TRUE"},
-            "11": {"Frame color": "GREY", "Logo": "FALSE"},
-            "12": {"Frame color": "BROWN", "Logo": "TRUE"},
-            "13": {"Frame color": "SILVER", "Logo": "TRUE"},
-            "14": {"Frame color": "GOLD", "Logo": "FALSE"},
-            "15": {"Frame color": "MAROON", "Logo": "TRUE"},
-            "16": {"Frame color": "NAVY", "Logo": "FALSE"},
-            "17": {"Frame color": "LIME", "Logo": "TRUE"}
+        "SR2": {
+            "Groupset manufacturer": "SRAM",
+            "Groupset name": "X5",
+            "Gears": "27"
         }
+    },
+    'suspension_specs': {
+        "-": {
+            "Has suspension": "FALSE",
+            "Suspension travel": "Not applicable"
+        },
+        "C": {
+            "Has suspension": "TRUE",
+            "Suspension travel": "80 mm"
+        },
+        "A": {
+            "Has suspension": "TRUE",
+            "Suspension travel": "120 mm"
+        }
+    },
+    'color_specs': {
+        "01": {"Frame color": "RED", "Logo": "TRUE"},
+        "02": {"Frame color": "BLUE", "Logo": "TRUE"},
+        "03": {"Frame color": "CYAN", "Logo": "FALSE"},
+        "04": {"Frame color": "GREEN", "Logo": "TRUE"},
+        "05": {"Frame color": "YELLOW", "Logo": "FALSE"},
+        "06": {"Frame color": "BLACK", "Logo": "TRUE"},
+        "07": {"Frame color": "WHITE", "Logo": "FALSE"},
+        "08": {"Frame color": "ORANGE", "Logo": "TRUE"},
+        "09": {"Frame color": "PURPLE", "Logo": "FALSE"},
+        "10": {"Frame color": "PINK", "Logo": "TRUE"},
+        "11": {"Frame color": "GREY", "Logo": "FALSE"},
+        "12": {"Frame color": "BROWN", "Logo": "TRUE"},
+        "13": {"Frame color": "SILVER", "Logo": "TRUE"},
+        "14": {"Frame color": "GOLD", "Logo": "FALSE"},
+        "15": {"Frame color": "MAROON", "Logo": "TRUE"},
+        "16": {"Frame color": "NAVY", "Logo": "FALSE"},
+        "17": {"Frame color": "LIME", "Logo": "TRUE"}
     }
+})
 
 
+@cython.locals(models=list, brakes=list, wheels=list, frame_sizes=list,
+               groupsets=list, suspensions=list, colors=list, brake_table=dict,
+               wheel_table=dict, frame_table=dict, groupset_table=dict,
+               suspension_table=dict, color_table=dict, empty=dict, finishes=list,
+               parts=tuple, model=str, brake=str, wheel=str, frame_size=str,
+               groupset=str, id_prefix=str, prefix=dict, id_suffix=str,
+               finish_spec=dict, bike_id=str, bicycle=dict)
 def _generate_all_bicycles(designators, general_specs, component_specs):
-    """Generate all possible bicycle combinations"""
-    bicycles = []
-    
+    """Yield all possible bicycle combinations"""
     # Extract component lists
     models = designators.get('Model number', [''])
     brakes = designators.get('Brakes', [])
@@ -270,83 +449,158 @@ def _generate_all_bicycles(designators, general_specs, component_specs):
     groupsets = designators.get('Groupset', [])
     suspensions = designators.get('Suspension', [])
     colors = designators.get('Color', [])
-    
+
+    # Drop missing components once up front (model number may be empty)
+    brakes = [b for b in brakes if b]
+    wheels = [w for w in wheels if w]
+    frame_sizes = [f for f in frame_sizes if f]
+    groupsets = [g for g in groupsets if g]
+    suspensions = [s for s in suspensions if s]
+    colors = [c for c in colors if c]
+
+    # Nothing to generate if any component has no options
+    if not (models and brakes and wheels and frame_sizes and groupsets and suspensions and colors):
+        return
+
+    # Look up component spec tables once; unknown designators contribute no specs
+    brake_table = component_specs['brake_specs']
+    wheel_table = component_specs['wheel_specs']
+    frame_table = component_specs['frame_specs']
+    groupset_table = component_specs['groupset_specs']
+    suspension_table = component_specs['suspension_specs']
+    color_table = component_specs['color_specs']
+    empty = {}
+
+    # Suspension and color vary fastest, so resolve their ID suffix and merged
+    # specs once for all outer combinations
+    finishes = [
+        (suspension + color, {**suspension_table.get(suspension, empty), **color_table.get(color, empty)})
+        for suspension, color in itertools.product(suspensions, colors)
+    ]
+
     # Generate all combinations
-    for model in models:
-        for brake in brakes:
-            for wheel in wheels:
-                for frame_size in frame_sizes:
-                    for groupset in groupsets:
-                        for suspension in suspensions:
-                            for color in colors:
-                                # Skip if any required component is missing
-                                if not all([brake, wheel, frame_size, groupset, suspension, color]):
-                                    continue
-                                
-                                # Generate bicycle ID
-                                bike_id = f"{model}{brake}{wheel}{frame_size}{groupset}{suspension}{color}"
-                                
-                                # Build bicycle specifications
-                                bicycle = {"ID": bike_id}
-                                bicycle.update(general_specs)
-                                
-                                # Add component-specific specs
-                                _add_component_specs(bicycle, brake, wheel, frame_size, 
-                                                   groupset, suspension, color, component_specs)
-                                
-                                bicycles.append(bicycle)
-    
-    return bicycles
+    for parts in itertools.product(models, brakes, wheels, frame_sizes, groupsets):
+        model, brake, wheel, frame_size, groupset = parts
+
+        # Specs and ID prefix shared by every suspension/color finish of this frame
+        id_prefix = ''.join(parts)
+        prefix = {
+            **general_specs,
+            **brake_table.get(brake, empty),
+            **wheel_table.get(wheel, empty),
+            **frame_table.get(frame_size, empty),
+            **groupset_table.get(groupset, empty),
+        }
 
+        for id_suffix, finish_spec in finishes:
+            # Generate bicycle ID (all designators are already strings)
+            bike_id = id_prefix + id_suffix
 
-def _add_component_specs(bicycle, brake, wheel, frame_size, groupset, suspension, color, component_specs):
-    """Add component-specific specifications to bicycle"""
-    
-    # Add brake specs
-    if brake in component_specs['brake_specs']:
-        bicycle.update(component_specs['brake_specs'][brake])
-    
-    # Add wheel specs
-    if wheel in component_specs['wheel_specs']:
-        bicycle.update(component_specs['wheel_specs'][wheel])
-    
-    # Add frame specs
-    if frame_size in component_specs['frame_specs']:
-        bicycle.update(component_specs['frame_specs'][frame_size])
-    
-    # Add groupset specs
-    if groupset in component_specs['groupset_specs']:
-        bicycle.update(component_specs['groupset_specs'][groupset])
-    
-    # Add suspension specs
-    if suspension in component_specs['suspension_specs']:
-        bicycle.update(component_specs['suspension_specs'][suspension])
-    
-    # Add color specs
-    if color in component_specs['color_specs']:
-        bicycle.update(component_specs['color_specs'][color])
+            # Build bicycle specifications in a single merge
+            bicycle = {"ID": bike_id, **prefix, **finish_spec}
+
+            yield bicycle
+
+
+# Read-only generation inputs of a worker process, set by _init_worker
+_worker_inputs = None
+
+
+def _init_worker(designators, general_specs, component_specs):
+    """Store the shared generation inputs once per worker process"""
+    global _worker_inputs
+    _worker_inputs = (designators, general_specs, component_specs)
+
+
+def _generate_shard(model, brake, wheel):
+    """Generate all bicycles of one model, brake and wheel option in a worker process"""
+    designators, general_specs, component_specs = _worker_inputs
+    shard = {**designators, 'Model number': [model], 'Brakes': [brake], 'Wheels': [wheel]}
+    return list(_generate_all_bicycles(shard, general_specs, component_specs))
+
+
+def _generate_bicycles_parallel(designators, general_specs, component_specs, workers):
+    """Yield all bicycle combinations, generated in worker processes"""
+    models = designators.get('Model number', [''])
+    brakes = [b for b in designators.get('Brakes', []) if b]
+    wheels = [w for w in designators.get('Wheels', []) if w]
+
+    # One shard per (model, brake, wheel) keeps the same order as _generate_all_bicycles
+    if not (models and brakes and wheels):
+        return
+    shards = itertools.product(models, brakes, wheels)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(designators, general_specs, component_specs)) as executor:
+        # Keep a sliding window of two shards per worker in flight, so workers
+        # that outpace the consumer cannot pile the whole catalog up here; at
+        # most 2 * workers + 1 shards (including the one being yielded) are held
+        pending = deque(executor.submit(_generate_shard, *shard)
+                        for shard in itertools.islice(shards, 2 * workers))
+        while pending:
+            bicycles = pending.popleft().result()
+            for shard in itertools.islice(shards, 1):
+                pending.append(executor.submit(_generate_shard, *shard))
+            yield from bicycles
 
 
 # Module-level convenience function (main interface)
-def main():
+def main(argv: Optional[List[str]] = None):
     """
     Main function for command-line usage.
     For module usage, call generate_bicycles() directly.
+    
+    Args:
+        argv (list, optional): Command line including the program name
+            (default: sys.argv)
     """
-    import sys
+    args = list(sys.argv if argv is None else argv)[1:]
+    fmt = 'json'
+    if '--ndjson' in args:
+        args.remove('--ndjson')
+        fmt = 'ndjson'
+    pretty = False
+    if '--pretty' in args:
+        args.remove('--pretty')
+        pretty = True
     
-    if len(sys.argv) != 2:
-        print("Usage: python bicycle_generator.py <excel_file_path>")
+    if len(args) != 1:
+        print("Usage: python bicycle_generator.py [--ndjson | --pretty] <excel_file_path>", file=sys.stderr)
         sys.exit(1)
     
-    excel_path = sys.argv[1]
+    excel_path = args[0]
+    
+    # Specs contain non-ASCII text (″, °) and orjson never escapes it, so
+    # always emit UTF-8 whatever the locale's stdout encoding is. Write
+    # through a local wrapper so sys.stdout itself is left as it was.
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    if stdout_buffer is not None:
+        sys.stdout.flush()
+        out = io.TextIOWrapper(stdout_buffer, encoding='utf-8')
+    else:
+        out = sys.stdout
     
     try:
-        json_output = generate_bicycles(excel_path)
-        print(json_output)
+        # Stream straight to stdout so large catalogs are never held in memory
+        generate_bicycles_stream(excel_path, out, pretty=pretty, fmt=fmt)
+        if fmt == 'json':
+            out.write("\n")
+        out.flush()
+    except BrokenPipeError:
+        # The reader stopped early (e.g. piped into head). As the Python docs
+        # recommend, point stdout at devnull so the remaining flushes succeed,
+        # and exit without an error message
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
     except Exception as e:
-        print(f"Error: {e}")
+        # Keep stdout for data only; a partial document may already be there
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if out is not sys.stdout:
+            # Flush and release the buffer without closing sys.stdout
+            out.detach()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""
+Build script for the bicycle generator module.
+
+The module is plain Python; when Cython is installed the hot combination
+loop is compiled to a C extension using its pure-Python mode annotations.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("bicycle_generator.py", language_level=3)
+
+setup(
+    name="bicycle-generator",
+    version="1.0.0",
+    description="Generate all bicycle modifications from an Excel specification file",
+    py_modules=["bicycle_generator"],
+    ext_modules=ext_modules,
+    python_requires=">=3.9",
+    install_requires=["openpyxl"],
+    extras_require={"fast": ["orjson", "python-calamine"]},
+)
@@ -8,123 +8,185 @@ Tests the module according to requirements:
 """
 
 import unittest
+from unittest import mock
+import contextlib
+import inspect
+import io
 import json
 import tempfile
+import shutil
 import os
-import pandas as pd
+import re
+import openpyxl
 import time
 import gc
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Annotated
 # Import the bicycle generator module
 import bicycle_generator
 
+try:
+    import orjson
+    _loads = orjson.loads  # accepts str as well as bytes
+except ImportError:
+    _loads = json.loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _Bike(msgspec.Struct):
+        """Fields every generated bicycle must carry; decoding fails if one is missing"""
+        ID: Annotated[str, msgspec.Meta(min_length=1)]
+        Manufacturer: str
+        Type: str
+        frame_type: str = msgspec.field(name='Frame type')
+        frame_material: str = msgspec.field(name='Frame material')
+
+# Only Windows holds file handles open long enough to need cleanup delays
+_ON_WINDOWS = os.name == 'nt'
+
+_get_id = itemgetter('ID')
+
+# Any non-empty single-line ID
+_ID_RE = re.compile(r'^.+$')
+
+# Brake and wheel designators by position: they directly follow the model
+# number, so letters in later designators (the R in SRAM groupsets) never match
+_COMPONENT_TOKEN_RE = re.compile(r'^(?:[A-Z]+-)?(?P<brake>[RD])(?P<wheel>2[679])')
+
+# Specifications each ID token implies
+_TOKEN_EXPECT = {
+    'R': {'Brake type': 'Rim', 'Brake warranty': '2 years'},
+    'D': {'Brake type': 'Disc', 'Brake warranty': '5 years'},
+    '26': {'Wheel diameter': '26″'},
+    '27': {'Wheel diameter': '27″'},
+    '29': {'Wheel diameter': '29″'},
+}
+
+
+def _write_xlsx(target, sheets, blank_rows=0, blank_cols=0):
+    """Write {sheet name: {column name: values}} to an XLSX file path or binary buffer with openpyxl,
+    optionally preceded by blank rows and columns so the data doesn't start at A1"""
+    # Write-only workbooks stream rows out without building a cell grid
+    workbook = openpyxl.Workbook(write_only=True)
+    padding = (None,) * blank_cols
+    for sheet_name, data in sheets.items():
+        worksheet = workbook.create_sheet(sheet_name)
+        for _ in range(blank_rows):
+            worksheet.append([])
+        worksheet.append(padding + tuple(data))
+        for row in zip(*data.values()):
+            worksheet.append(padding + row)
+    workbook.save(target)
+
 
 class TestBicycleGeneratorModule(unittest.TestCase):
     """Test suite for bicycle generator module"""
 
-    def setUp(self):
-        """Set up test data and temporary Excel files"""
-        self.temp_files = []
-        
-        # Create test Excel file with proper sheet structure
-        self.test_excel_path = self._create_test_excel_file()
-        
-        # Create test Excel file with combined format (like CSV converted)
-        self.test_combined_excel_path = self._create_combined_test_excel_file()
-
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data and temporary Excel files once for all tests"""
+        cls._tmpdir = tempfile.mkdtemp()
+        
+        # Build both workbooks concurrently; zlib releases the GIL while compressing
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Test Excel file with proper sheet structure
+            id_future = executor.submit(cls._create_test_excel_file)
+            # Test Excel file with combined format (like CSV converted)
+            combined_future = executor.submit(cls._create_combined_test_excel_file)
+            cls.test_excel_path = id_future.result()
+            cls.test_combined_excel_path = combined_future.result()
+        
+        # Non-Excel file for the extension check
+        cls.test_txt_path = os.path.join(cls._tmpdir, 'bicycles.txt')
+        open(cls.test_txt_path, 'w').close()
+        
+        # Generate once from the combined workbook; tests only read these
+        cls._json_output = bicycle_generator.generate_bicycles(cls._combined_buffer())
+        cls._bicycles = _loads(cls._json_output)
+        
+        # Introspect the public entry point once
+        cls._sig = inspect.signature(bicycle_generator.generate_bicycles)
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files"""
-        # Force garbage collection to release file handles
-        gc.collect()
-        
-        # Wait a bit for Windows to release file handles
-        time.sleep(0.1)
-        
-        for temp_file in self.temp_files:
-            if os.path.exists(temp_file):
-                self.safe_unlink(temp_file)
-
-    def safe_unlink(self, path, retries=10, delay=0.1):
-        """Safely delete a file with retries for Windows file locking issues"""
-        for attempt in range(retries):
-            try:
-                if os.path.exists(path):
-                    os.unlink(path)
-                return
-            except PermissionError:
-                if attempt < retries - 1:
-                    time.sleep(delay)
-                    gc.collect()  # Force garbage collection
-                else:
-                    # Last attempt - try to make file writable first
-                    try:
-                        os.chmod(path, 0o777)
-                        os.unlink(path)
-                    except:
-                        print(f"Warning: Could not delete temporary file {path}")
-
-    def _create_test_excel_file(self):
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    @classmethod
+    def _create_test_excel_file(cls):
         """Create a proper test Excel file with ID, GENERAL sheets"""
-        temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
-        temp_file.close()
-        self.temp_files.append(temp_file.name)
+        path = os.path.join(cls._tmpdir, 'id.xlsx')
+        
+        # ID sheet - designator structure
+        id_data = {
+            'Model number': ['CITY-', 'MOUNTAIN-'],
+            'Brakes': ['R', 'D'],
+            'Wheels': ['26', '27'],
+            'Frame size': ['S', 'M'],
+            'Groupset': ['SH1', 'SH2'],
+            'Suspension': ['-', 'C'],
+            'Color': ['01', '02']
+        }
+        
+        # GENERAL sheet - common specifications
+        general_data = {
+            'Field': ['Manufacturer', 'Type', 'Frame material'],
+            'Value': ['Test Bikes Inc', 'Test Type', 'Carbon']
+        }
         
-        # Create Excel writer with explicit engine and close it properly
         try:
-            with pd.ExcelWriter(temp_file.name, engine='openpyxl') as writer:
-                # ID sheet - designator structure
-                id_data = {
-                    'Model number': ['CITY-', 'MOUNTAIN-'],
-                    'Brakes': ['R', 'D'],
-                    'Wheels': ['26', '27'],
-                    'Frame size': ['S', 'M'],
-                    'Groupset': ['SH1', 'SH2'],
-                    'Suspension': ['-', 'C'],
-                    'Color': ['01', '02']
-                }
-                id_df = pd.DataFrame(id_data)
-                id_df.to_excel(writer, sheet_name='ID', index=False)
-                
-                # GENERAL sheet - common specifications
-                general_data = {
-                    'Field': ['Manufacturer', 'Type', 'Frame material'],
-                    'Value': ['Test Bikes Inc', 'Test Type', 'Carbon']
-                }
-                general_df = pd.DataFrame(general_data)
-                general_df.to_excel(writer, sheet_name='GENERAL', index=False)
+            _write_xlsx(path, {
+                'ID': id_data,
+                'GENERAL': general_data,
+            })
         except Exception as e:
             print(f"Error creating test Excel file: {e}")
             raise
         
-        return temp_file.name
+        return path
 
-    def _create_combined_test_excel_file(self):
+    @classmethod
+    def _create_combined_test_excel_file(cls):
         """Create test Excel file in combined format (like CSV data)"""
-        temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
-        temp_file.close()
-        self.temp_files.append(temp_file.name)
+        path = os.path.join(cls._tmpdir, 'combined.xlsx')
         
         # Create data similar to the CSV format
         data = {
-            'Model number': ['CITY-', '', ''],
-            'Brakes': ['R', 'D', ''],
-            'Wheels': ['26', '27', '29'],
-            'Frame size': ['S', 'M', 'L'],
-            'Groupset': ['SH1', 'SH2', 'SH3'],
-            'Suspension': ['-', 'C', 'A'],
-            'Color': ['01', '02', '03']
+            'Model number': ['CITY-', '', '', ''],
+            'Brakes': ['R', 'D', '', ''],
+            'Wheels': ['26', '27', '29', ''],
+            'Frame size': ['S', 'M', 'L', ''],
+            # SR1 puts an R after the brake designator in the ID
+            'Groupset': ['SH1', 'SH2', 'SH3', 'SR1'],
+            'Suspension': ['-', 'C', 'A', ''],
+            'Color': ['01', '02', '03', '']
         }
         
         try:
-            df = pd.DataFrame(data)
-            # Use context manager to ensure proper file closure
-            with pd.ExcelWriter(temp_file.name, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False)
+            # Build the workbook in memory for the buffer-based tests and
+            # keep a copy on disk for the path-based ones
+            cls._combined_data = data
+            buffer = io.BytesIO()
+            _write_xlsx(buffer, {'Sheet1': data})
+            cls._combined_xlsx = buffer.getvalue()
+            with open(path, 'wb') as f:
+                f.write(cls._combined_xlsx)
         except Exception as e:
             print(f"Error creating combined test Excel file: {e}")
             raise
         
-        return temp_file.name
+        return path
+
+    @classmethod
+    def _combined_buffer(cls):
+        """Return a fresh in-memory copy of the combined test workbook"""
+        return io.BytesIO(cls._combined_xlsx)
 
     def test_requirement_1_python_module_implementation(self):
         """Test Requirement 1: Implemented as Python module"""
@@ -133,23 +195,27 @@ class TestBicycleGeneratorModule(unittest.TestCase):
         self.assertTrue(callable(bicycle_generator.generate_bicycles))
         
         # Test that function signature is correct
-        import inspect
-        sig = inspect.signature(bicycle_generator.generate_bicycles)
-        params = list(sig.parameters.keys())
-        self.assertEqual(len(params), 1)
-        self.assertEqual(params[0], 'excel_path')
+        params = list(self._sig.parameters.values())
+        self.assertEqual(params[0].name, 'excel_path')
+        # Any further parameters are optional keyword-only flags
+        for param in params[1:]:
+            self.assertEqual(param.kind, inspect.Parameter.KEYWORD_ONLY)
+            self.assertIsNot(param.default, inspect.Parameter.empty)
 
     def test_requirement_2_string_input_output(self):
         """Test Requirement 2: String input (Excel path) -> String output (JSON)"""
-        # Test with string path input
+        # Test with string path input (a fresh call, independent of the cached output)
         result = bicycle_generator.generate_bicycles(self.test_combined_excel_path)
         
         # Verify output is a string
         self.assertIsInstance(result, str)
         
+        # Repeated calls on the same input give the same document
+        self.assertEqual(result, self._json_output)
+        
         # Verify output is valid JSON
         try:
-            json_data = json.loads(result)
+            json_data = _loads(result)
             self.assertIsInstance(json_data, list)
         except json.JSONDecodeError:
             self.fail("Output is not valid JSON")
@@ -162,16 +228,36 @@ class TestBicycleGeneratorModule(unittest.TestCase):
         self.assertTrue(os.path.exists(excel_path))
         self.assertTrue(excel_path.endswith('.xlsx'))
         
-        # Generate bicycles
-        json_output = bicycle_generator.generate_bicycles(excel_path)
-        
-        # Validate output structure
-        bicycles = json.loads(json_output)
+        # Validate output structure of the generated bicycles
+        bicycles = self._bicycles
         
         # Check that we have generated bicycles
         self.assertGreater(len(bicycles), 0)
         
         # Validate each bicycle has required structure
+        if msgspec is not None:
+            # The schema is enforced while decoding, in a single pass
+            self._decode_bikes(self._json_output)
+        else:
+            self._check_required_fields(bicycles)
+        
+        # Validate specific combinations exist (one substring scan over all IDs;
+        # IDs never contain newlines, so matches cannot span two IDs)
+        bike_ids = '\n'.join(map(_get_id, bicycles))
+        
+        # Check that combinations are properly generated
+        self.assertIn('R26S', bike_ids)  # Rim brakes, 26" wheels, Small frame
+        self.assertIn('D27M', bike_ids)  # Disc brakes, 27" wheels, Medium frame
+
+    def _decode_bikes(self, json_output):
+        """Decode the JSON document into _Bike structs, failing on any missing or mistyped field"""
+        try:
+            return msgspec.json.decode(json_output, type=list[_Bike])
+        except msgspec.ValidationError as e:
+            self.fail(f"Bicycle does not match the expected schema: {e}")
+
+    def _check_required_fields(self, bicycles):
+        """Check the required fields bicycle by bicycle (fallback when msgspec is not installed)"""
         for bicycle in bicycles:
             # Must have ID
             self.assertIn('ID', bicycle)
@@ -179,47 +265,32 @@ class TestBicycleGeneratorModule(unittest.TestCase):
             self.assertGreater(len(bicycle['ID']), 0)
             
             # Must have other required fields
-            required_fields = ['Manufacturer', 'Type', 'Frame material']
+            required_fields = ['Manufacturer', 'Type', 'Frame type', 'Frame material']
             for field in required_fields:
                 self.assertIn(field, bicycle)
-        
-        # Validate specific combinations exist
-        bike_ids = [bike['ID'] for bike in bicycles]
-        
-        # Check that combinations are properly generated
-        self.assertTrue(any('R26S' in bike_id for bike_id in bike_ids))  # Rim brakes, 26" wheels, Small frame
-        self.assertTrue(any('D27M' in bike_id for bike_id in bike_ids))  # Disc brakes, 27" wheels, Medium frame
 
     def test_excel_file_validation(self):
         """Test Excel file validation"""
-        
-        # Test non-existent file
-        with self.assertRaises(FileNotFoundError):
-            bicycle_generator.generate_bicycles("/non/existent/file.xlsx")
-        
-        # Test wrong file extension
-        temp_txt = tempfile.NamedTemporaryFile(suffix='.txt', delete=False)
-        temp_txt.close()
-        self.temp_files.append(temp_txt.name)
-        
-        with self.assertRaises(ValueError):
-            bicycle_generator.generate_bicycles(temp_txt.name)
-        
-        # Test invalid input type
-        with self.assertRaises(ValueError):
-            bicycle_generator.generate_bicycles(123)  # Not a string
+        cases = [
+            ("/non/existent/file.xlsx", FileNotFoundError),  # Non-existent file
+            (self.test_txt_path, ValueError),  # Wrong file extension
+            (123, ValueError),  # Neither a path nor a file-like object
+        ]
+        for excel_path, error in cases:
+            with self.subTest(excel_path=excel_path):
+                with self.assertRaises(error):
+                    bicycle_generator.generate_bicycles(excel_path)
 
     def test_json_output_format(self):
         """Test that output JSON format matches specification"""
-        json_output = bicycle_generator.generate_bicycles(self.test_combined_excel_path)
-        bicycles = json.loads(json_output)
+        bicycles = self._bicycles
         
         # Test first bicycle for expected structure
         if bicycles:
             first_bike = bicycles[0]
             
             # Check ID format
-            self.assertRegex(first_bike['ID'], r'^.+$')  # Non-empty string
+            self.assertRegex(first_bike['ID'], _ID_RE)  # Non-empty string
             
             # Check required fields exist
             expected_fields = [
@@ -228,85 +299,242 @@ class TestBicycleGeneratorModule(unittest.TestCase):
             for field in expected_fields:
                 self.assertIn(field, first_bike)
 
+    def test_pretty_output(self):
+        """Test that pretty output is indented and parses to the same data"""
+        compact = self._json_output
+        pretty = bicycle_generator.generate_bicycles(self._combined_buffer(), pretty=True)
+        
+        self.assertNotIn('\n', compact)
+        self.assertTrue(pretty.startswith('[\n  {'))
+        self.assertEqual(_loads(compact), _loads(pretty))
+
+    def test_stream_output(self):
+        """Test that streaming to a text handle matches the string output"""
+        out = io.StringIO()
+        result = bicycle_generator.generate_bicycles_stream(self._combined_buffer(), out)
+        
+        self.assertIsNone(result)
+        self.assertEqual(out.getvalue(), self._json_output)
+
+    def test_stream_write_error_is_not_wrapped(self):
+        """Test that errors writing to the output stream reach the caller unchanged"""
+        class FullDisk(io.StringIO):
+            def write(self, s):
+                raise OSError(28, 'No space left on device')
+        
+        with self.assertRaises(OSError) as cm:
+            bicycle_generator.generate_bicycles_stream(self._combined_buffer(), FullDisk())
+        self.assertEqual(cm.exception.errno, 28)
+
+    def test_file_like_input(self):
+        """Test that a binary buffer gives the same document as the path and is left open"""
+        buffer = self._combined_buffer()
+        result = bicycle_generator.generate_bicycles(buffer)
+        
+        self.assertFalse(buffer.closed)
+        self.assertEqual(result, bicycle_generator.generate_bicycles(self.test_combined_excel_path))
+        
+        # The same buffer can be passed again, even after it was partly read
+        buffer.read(10)
+        self.assertEqual(bicycle_generator.generate_bicycles(buffer), result)
+        with mock.patch.object(bicycle_generator, 'CalamineWorkbook', None):
+            buffer.read(10)
+            self.assertEqual(bicycle_generator.generate_bicycles(buffer), result)
+
+    def test_ndjson_output(self):
+        """Test that NDJSON output has one bicycle per line"""
+        ndjson_output = bicycle_generator.generate_bicycles(self._combined_buffer(), fmt='ndjson')
+        
+        lines = ndjson_output.splitlines()
+        self.assertTrue(ndjson_output.endswith('\n'))
+        self.assertEqual([_loads(line) for line in lines], self._bicycles)
+        
+        with self.assertRaises(ValueError):
+            bicycle_generator.generate_bicycles(self._combined_buffer(), fmt='xml')
+
+    def test_parallel_generation(self):
+        """Test that generating in worker processes gives the same document"""
+        parallel = bicycle_generator.generate_bicycles(self._combined_buffer(), workers=2)
+        
+        self.assertEqual(parallel, self._json_output)
+
+    def test_parallel_generation_bounds_pending_shards(self):
+        """Test that parallel generation keeps at most two shards per worker in flight"""
+        submitted = []
+        
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                submitted.append(args)
+                return super().submit(fn, *args)
+        
+        # 1 model × 2 brakes × 3 wheels = 6 shards, more than the window of 4
+        designators = {
+            'Model number': ['CITY-'], 'Brakes': ['R', 'D'], 'Wheels': ['26', '27', '29'],
+            'Frame size': ['S'], 'Groupset': ['SH1'], 'Suspension': ['-'], 'Color': ['01'],
+        }
+        args = (designators, bicycle_generator._DEFAULT_GENERAL_SPECS, bicycle_generator._COMPONENT_SPECS)
+        # The thread pool runs _init_worker in this process; restore its inputs afterwards
+        with mock.patch.object(bicycle_generator, 'ProcessPoolExecutor', CountingExecutor), \
+                mock.patch.object(bicycle_generator, '_worker_inputs', None):
+            bicycles = bicycle_generator._generate_bicycles_parallel(*args, workers=2)
+            first = next(bicycles)
+            # The window of 4, refilled once when the first shard was taken:
+            # 2 * workers + 1 shards submitted, the first one being yielded
+            self.assertEqual(len(submitted), 5)
+            rest = list(bicycles)
+        
+        self.assertEqual(len(submitted), 6)
+        self.assertIsNone(bicycle_generator._worker_inputs)
+        self.assertEqual([first] + rest, list(bicycle_generator._generate_all_bicycles(*args)))
+
+    @unittest.skipUnless(bicycle_generator.CalamineWorkbook is not None, "python-calamine is not installed")
+    def test_calamine_matches_openpyxl(self):
+        """Test that the calamine and openpyxl readers produce the same document"""
+        # Sheets that don't start at A1 must keep their leading blank area in both readers
+        def offset_combined(blank_rows, blank_cols):
+            buffer = io.BytesIO()
+            _write_xlsx(buffer, {'Sheet1': self._combined_data}, blank_rows=blank_rows, blank_cols=blank_cols)
+            return lambda xlsx=buffer.getvalue(): io.BytesIO(xlsx)
+        
+        # source name: (input factory, expected number of bicycles)
+        sources = {
+            'ID sheet': (lambda: self.test_excel_path, 2 ** 7),
+            'combined': (lambda: self.test_combined_excel_path, len(self._bicycles)),
+            # The blank first row is read as the header, so no designator columns are found
+            'combined, 1 blank row': (offset_combined(1, 0), 0),
+            # A blank leading column has no header and is ignored
+            'combined, 1 blank column': (offset_combined(0, 1), len(self._bicycles)),
+        }
+        for name, (source, expected_count) in sources.items():
+            with self.subTest(source=name):
+                calamine_output = bicycle_generator.generate_bicycles(source())
+                with mock.patch.object(bicycle_generator, 'CalamineWorkbook', None):
+                    openpyxl_output = bicycle_generator.generate_bicycles(source())
+                
+                self.assertEqual(calamine_output, openpyxl_output)
+                self.assertEqual(len(_loads(calamine_output)), expected_count)
+
+    def test_missing_component_yields_no_bicycles(self):
+        """Test that an empty designator list produces an empty catalog"""
+        designators = {'Model number': ['CITY-'], 'Brakes': ['R'], 'Wheels': []}
+        bicycles = bicycle_generator._generate_all_bicycles(
+            designators, bicycle_generator._DEFAULT_GENERAL_SPECS, bicycle_generator._COMPONENT_SPECS)
+        
+        self.assertEqual(list(bicycles), [])
+
     def test_component_specifications(self):
         """Test that component specifications are correctly applied"""
-        json_output = bicycle_generator.generate_bicycles(self.test_combined_excel_path)
-        bicycles = json.loads(json_output)
+        bicycles = self._bicycles
         
         # Find bicycles with specific components and verify specs
         for bicycle in bicycles:
-            bike_id = bicycle['ID']
-            
-            # Test brake specifications
-            if 'R' in bike_id:  # Rim brakes
-                self.assertEqual(bicycle.get('Brake type'), 'Rim')
-                self.assertEqual(bicycle.get('Brake warranty'), '2 years')
-            elif 'D' in bike_id:  # Disc brakes
-                self.assertEqual(bicycle.get('Brake type'), 'Disc')
-                self.assertEqual(bicycle.get('Brake warranty'), '5 years')
+            # Parse the brake and wheel designators out of the ID
+            match = _COMPONENT_TOKEN_RE.match(bicycle['ID'])
+            self.assertIsNotNone(match, f"Unexpected ID layout: {bicycle['ID']}")
+            tokens = match.group('brake', 'wheel')
             
-            # Test wheel specifications
-            if '26' in bike_id:
-                self.assertEqual(bicycle.get('Wheel diameter'), '26″')
-            elif '27' in bike_id:
-                self.assertEqual(bicycle.get('Wheel diameter'), '27″')
+            # Test brake and wheel specifications
+            for token in tokens:
+                for field, expected in _TOKEN_EXPECT[token].items():
+                    self.assertEqual(bicycle.get(field), expected)
 
     def test_comprehensive_bicycle_generation(self):
         """Test comprehensive bicycle generation from all combinations"""
-        json_output = bicycle_generator.generate_bicycles(self.test_combined_excel_path)
-        bicycles = json.loads(json_output)
+        bicycles = self._bicycles
         
         # Calculate expected number of combinations
-        # From our test data: 1 model × 2 brakes × 3 wheels × 3 frames × 3 groupsets × 3 suspensions × 3 colors
+        # From our test data: 1 model × 2 brakes × 3 wheels × 3 frames × 4 groupsets × 3 suspensions × 3 colors
         # But only valid combinations (no empty values)
         self.assertGreater(len(bicycles), 10)  # Should have many combinations
         
-        # Verify all bicycles have unique IDs
-        bike_ids = [bike['ID'] for bike in bicycles]
-        self.assertEqual(len(bike_ids), len(set(bike_ids)))  # All unique
-
-# Replace the test_module_as_script method in test_bicycle_generator.py
-# around line 270-302 with this corrected version:
-
-def test_module_as_script(self):
-    """Test that module can be run as script"""
-    # This tests the main() function
-    import subprocess
-    
-    # Fix Windows path escaping issue
-    safe_path = self.test_combined_excel_path.replace('\\', '\\\\')
-    
-    # Run module as script with proper error handling
-    try:
-        result = subprocess.run([
-            sys.executable, '-c', 
-            f'''
-import sys
-sys.path.insert(0, ".")
-import json
-try:
-    import bicycle_generator
-    json_output = bicycle_generator.generate_bicycles(r"{self.test_combined_excel_path}")
-    bicycles = json.loads(json_output) if json_output else []
-    print(len(bicycles))
-except Exception as e:
-    print(f"Error: {{e}}")
-    sys.exit(1)
-'''
-        ], capture_output=True, text=True, timeout=30, cwd=os.getcwd())
-        
-        # Check if execution was successful
-        if result.returncode != 0:
-            print(f"Script execution failed:")
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-        
-        self.assertEqual(result.returncode, 0, f"Script failed with: {result.stderr}")
-        
-    except subprocess.TimeoutExpired:
-        self.fail("Module execution timed out")
-    except Exception as e:
-        self.fail(f"Subprocess execution failed: {e}")
+        # Verify all bicycles have unique IDs (single pass, stops at the first duplicate)
+        seen = set()
+        duplicate = next((bike_id for bike_id in map(_get_id, bicycles)
+                          if bike_id in seen or seen.add(bike_id)), None)
+        self.assertIsNone(duplicate)  # All unique
+
+    def test_module_as_script(self):
+        """Test that the command-line entry point prints the JSON document"""
+        # Call main() in-process with a script-style argv
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            bicycle_generator.main([bicycle_generator.__file__, self.test_combined_excel_path])
+        
+        self.assertEqual(_loads(stdout.getvalue()), self._bicycles)
+
+    def test_module_as_script_pretty(self):
+        """Test that --pretty makes the command-line entry point indent the document"""
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            bicycle_generator.main([bicycle_generator.__file__, '--pretty', self.test_combined_excel_path])
+        
+        pretty = bicycle_generator.generate_bicycles(self.test_combined_excel_path, pretty=True)
+        self.assertEqual(stdout.getvalue(), pretty + '\n')
+
+    def test_module_as_script_error_to_stderr(self):
+        """Test that command-line errors go to stderr, leaving stdout for data"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            with self.assertRaises(SystemExit) as cm:
+                bicycle_generator.main([bicycle_generator.__file__, "/non/existent/file.xlsx"])
+        
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertIn('Error: ', stderr.getvalue())
+
+    def test_module_as_script_broken_pipe(self):
+        """Test that the command-line entry point exits quietly when the reader closes the pipe"""
+        # A pipe whose read end is already closed, like `... | head` after it exits
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        stdout = io.TextIOWrapper(io.BufferedWriter(io.FileIO(write_fd, 'w')), encoding='utf-8')
+        stderr = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                with self.assertRaises(SystemExit) as cm:
+                    bicycle_generator.main([bicycle_generator.__file__, '--ndjson', self.test_combined_excel_path])
+        finally:
+            stdout.close()  # write_fd now points at devnull
+        
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(stderr.getvalue(), '')
+
+    def test_module_as_script_non_utf8_stdout(self):
+        """Test that the command-line entry point writes UTF-8 when stdout uses another encoding"""
+        # Like redirected output on Windows, where stdout defaults to the ANSI code page
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(raw, encoding='cp1252')
+        with contextlib.redirect_stdout(stdout):
+            bicycle_generator.main([bicycle_generator.__file__, self.test_combined_excel_path])
+        stdout.flush()
+        
+        self.assertEqual(_loads(raw.getvalue().decode('utf-8')), self._bicycles)
+        # The caller's stream keeps its own encoding
+        self.assertEqual(stdout.encoding, 'cp1252')
+
+    @unittest.skipUnless(os.environ.get('RUN_SUBPROCESS_TESTS'),
+                         "set RUN_SUBPROCESS_TESTS=1 to run the module in a separate interpreter")
+    def test_module_as_script_subprocess(self):
+        """Test that module can be run as script in a fresh interpreter"""
+        import subprocess
+        
+        # Run module as script with proper error handling
+        try:
+            result = subprocess.run(
+                [sys.executable, bicycle_generator.__file__, self.test_combined_excel_path],
+                capture_output=True, text=True, encoding='utf-8', timeout=30)
+            
+            # Check if execution was successful
+            if result.returncode != 0:
+                print("Script execution failed:")
+                print(f"STDOUT: {result.stdout}")
+                print(f"STDERR: {result.stderr}")
+            
+            self.assertEqual(result.returncode, 0, f"Script failed with: {result.stderr}")
+            self.assertEqual(_loads(result.stdout), self._bicycles)
+            
+        except subprocess.TimeoutExpired:
+            self.fail("Module execution timed out")
 
 
 def create_sample_excel_for_demo():
@@ -324,11 +552,8 @@ def create_sample_excel_for_demo():
         'Color': ['01', '02', '03', '04', '05', '06', '07']
     }
 
-    df = pd.DataFrame(data)
-    # Use ExcelWriter context manager to ensure file is properly closed
     try:
-        with pd.ExcelWriter(sample_path, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False)
+        _write_xlsx(sample_path, {'Sheet1': data})
     except Exception as e:
         print(f"Error creating sample Excel file: {e}")
         raise
@@ -336,7 +561,7 @@ def create_sample_excel_for_demo():
     return sample_path
 
 
-def safe_unlink(path, retries=10, delay=0.1):
+def safe_unlink(path, retries=10, delay=0.001):
     """Attempt to delete a file, retrying if PermissionError occurs."""
     for attempt in range(retries):
         try:
@@ -351,7 +576,9 @@ def safe_unlink(path, retries=10, delay=0.1):
         except PermissionError:
             if attempt < retries - 1:
                 time.sleep(delay)
-                gc.collect()  # Force garbage collection
+                delay *= 2  # Exponential backoff
+                if _ON_WINDOWS:
+                    gc.collect()  # Drop unreferenced handles still holding the file
             else:
                 print(f"Warning: Could not delete file {path} after {retries} attempts")
                 return
@@ -379,7 +606,7 @@ def demonstrate_requirements():
     # Generate bicycles using the module function
     try:
         json_result = bicycle_generator.generate_bicycles(sample_excel)
-        bicycles = json.loads(json_result)
+        bicycles = _loads(json_result)
         
         print(f"   - Output: JSON string with {len(bicycles)} bicycle modifications")
         print("   - First bicycle preview:")
@@ -400,9 +627,8 @@ def demonstrate_requirements():
 
     # Clean up with improved error handling
     if os.path.exists(sample_excel):
-        # Force garbage collection before deletion
-        gc.collect()
-        time.sleep(0.2)  # Wait for file handles to be released
+        if _ON_WINDOWS:
+            time.sleep(0.2)  # Wait for file handles to be released
         safe_unlink(sample_excel)
         print(f"\n✓ Cleaned up sample file: {sample_excel}")
 
@@ -424,14 +650,15 @@ def main():
         # Create a test suite to run with better error handling
         loader = unittest.TestLoader()
         suite = loader.loadTestsFromTestCase(TestBicycleGeneratorModule)
-        runner = unittest.TextTestRunner(verbosity=2, buffer=True)
+        # Quiet by default; set TEST_VERBOSE=1 to list each test and capture its output
+        verbose = bool(os.environ.get('TEST_VERBOSE'))
+        runner = unittest.TextTestRunner(verbosity=2 if verbose else 1, buffer=verbose)
         result = runner.run(suite)
         
         print("\n" + "=" * 50)
         
-        # Force cleanup before demonstration
-        gc.collect()
-        time.sleep(0.5)
+        if _ON_WINDOWS:
+            time.sleep(0.5)
         
         # Demonstrate requirements
         demonstrate_requirements()
@@ -450,8 +677,6 @@ def main():
     finally:
         # Ensure we're back in the original directory
         os.chdir(original_cwd)
-        # Final cleanup
-        gc.collect()
 
 
 if __name__ == "__main__":